@@ -46,6 +46,8 @@ class Handover(Base):
         nullable=False,
         server_default="OPEN",
     )
+    # 낙관적 동시성 제어용 버전 - 서비스 계층의 UPDATE 문이 "WHERE version = ?" 조건과
+    # version + 1을 직접 지정 (변경 행이 없으면 update_handover가 409 반환)
     version = Column(Integer, nullable=False, server_default=text("1"))
 
     # 관계 설정 - backref 대신 back_populates로 명시적 양방향 관계 정의
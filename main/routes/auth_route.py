@@ -36,10 +36,9 @@ async def login_page(request: Request):
     return_to = request.query_params.get("return_to", "/dashboard")
 
     # 이미 로그인된 경우 return_to로 리다이렉션
-    if request.session.get("user"):
-        logging.info(
-            f"로그인된 사용자 리다이렉트: {request.session.get('user').get('user_id', 'N/A')}"
-        )
+    user = request.session.get("user")
+    if user:
+        logging.info(f"로그인된 사용자 리다이렉트: {user.get('user_id', 'N/A')}")
         return RedirectResponse(url=return_to, status_code=status.HTTP_303_SEE_OTHER)
 
     # 중간 포인트 로깅
@@ -72,7 +71,7 @@ async def login(
     # 함수 진입점 로깅
     logging.info(f"login 시작: 사용자 ID={user_id}, return_to={return_to}")
 
-    authenticated, user_data = authenticate_user(db, user_id, user_password)
+    authenticated, user_data = await authenticate_user(db, user_id, user_password)
 
     if not authenticated or not user_data:
         # 중간 포인트 로깅 - 인증 실패
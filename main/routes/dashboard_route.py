@@ -8,7 +8,6 @@ from decimal import Decimal
 import json
 import logging
 import sys
-import traceback
 from urllib.parse import quote
 import pandas as pd
 import io
@@ -406,8 +406,7 @@ async def update_handover_api(
                 status_code=404, detail="수정할 인수인계를 찾을 수 없습니다."
             )
 
-        version_mismatch = current_handover.version != version
-        if version_mismatch:
+        if current_handover.version != version:
             logger.warning(
                 f"인수인계 수정 버전 불일치: ID={handover_id}, Client Version={version}, DB Version={current_handover.version}"
             )
@@ -425,9 +424,15 @@ async def update_handover_api(
                 if current_handover.update_at
                 else "알 수 없음"
             )
-            warning_msg = f"다른 사용자({concurrent_modifier_name})가 {concurrent_update_at}에 먼저 수정했습니다."
-        else:
-            warning_msg = None
+            # 낙관적 잠금 - 오래된 폼으로 최신 내용을 덮어쓰지 않도록 저장하지 않고 되돌림
+            error_message = quote(
+                f"다른 사용자({concurrent_modifier_name})가 {concurrent_update_at}에 먼저 수정했습니다. "
+                "새로고침 후 다시 시도해주세요."
+            )
+            return RedirectResponse(
+                f"{edit_url}?error={error_message}",
+                status_code=status.HTTP_303_SEE_OTHER,
+            )
 
         # 현재 인수인계 객체 조회 (권한 검증용) - get_handover_by_id 호출 중복 제거
         handover = current_handover  # 위에서 이미 조회함
@@ -479,16 +484,16 @@ async def update_handover_api(
             update_data=update_data,
             updated_by=user_id,
             user_role=user_role,
+            expected_version=version,  # 폼 제출 시점 버전 (조회~UPDATE 사이 변경도 409)
         )
 
         # 성공 메시지 및 리다이렉트
         success_message = quote("인수인계가 성공적으로 수정되었습니다.")
 
-        redirect_url = f"{detail_url}?success={success_message}"
-        if version_mismatch and warning_msg:  # 버전 불일치 시 경고 메시지 추가
-            redirect_url += f"&warning={quote(warning_msg)}"
-
-        return RedirectResponse(redirect_url, status_code=status.HTTP_303_SEE_OTHER)
+        return RedirectResponse(
+            f"{detail_url}?success={success_message}",
+            status_code=status.HTTP_303_SEE_OTHER,
+        )
 
     except HTTPException as http_exc:
         logger.warning(
@@ -19,7 +19,7 @@ import logging
 
 from main.core.templating import templates
 from main.utils.database import get_db
-from main.utils.security import get_admin_user, hash_password  # 관리자 전용 페이지
+from main.utils.security import get_admin_user, hash_password_async  # 관리자 전용 페이지
 from main.service.user_service import (
     get_user_list,
     create_user,
@@ -129,7 +129,7 @@ async def create_new_user(
         f"사용자 생성 API 호출: userId={user_id}, role={user_role}, by={current_admin.get('user_id')}"
     )
     try:
-        hashed_password = hash_password(user_password)
+        hashed_password = await hash_password_async(user_password)
         create_user(
             db=db,
             user_id=user_id,
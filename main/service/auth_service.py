@@ -8,10 +8,11 @@ from fastapi import HTTPException, status
 import logging
 
 from main.models.user_model import User
-from main.utils.security import verify_password
+from main.utils.permission import role_id_for
+from main.utils.security import verify_password_async
 
 
-def authenticate_user(
+async def authenticate_user(
     db: Session, user_id: str, user_password: str
 ) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """
@@ -35,11 +36,7 @@ def authenticate_user(
         # 사용자 ID로 사용자 검색
         user = db.query(User).filter(User.user_id == user_id).first()
 
-        # 쿼리 결과 로깅
-        if user:
-            # logging.debug(f"DB 쿼리 성공: 사용자 '{user_id}' 정보 로드 완료") # 프로덕션에서 불필요한 로그 제거
-            pass  # user가 있을 때 debug 로그만 있었으므로 pass 추가
-        else:
+        if not user:
             logging.warning(f"로그인 실패: 사용자 ID '{user_id}'를 찾을 수 없음")
             return False, None
 
@@ -47,7 +44,7 @@ def authenticate_user(
         # logging.debug(f"비밀번호 검증 시작: 사용자 '{user_id}'") # 프로덕션에서 불필요한 로그 제거
 
         # 비밀번호 검증
-        is_valid_password = verify_password(user_password, user.user_password)
+        is_valid_password = await verify_password_async(user_password, user.user_password)
 
         # 비밀번호 검증 결과 로깅
         if not is_valid_password:
@@ -61,6 +58,7 @@ def authenticate_user(
             "user_id": user.user_id,
             "user_name": user.user_name,
             "user_role": user.user_role,
+            "role_id": role_id_for(user.user_role),
             "user_department": user.user_department,
         }
 
@@ -4,7 +4,7 @@
 
 from typing import Optional, List, Dict, Tuple, Any
 from datetime import datetime, timedelta, date
-from sqlalchemy import and_, or_, func, text, desc, case, extract
+from sqlalchemy import and_, or_, func, text, desc, case, extract, select, update
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
@@ -265,8 +265,13 @@ def update_dashboard(
             old_status = order.status
             new_status = update_fields["status"]
             now = datetime.now()
-            logger.info(
-                f"DEBUG (update_dashboard entry): Order ID {dashboard_id}, Old Status: {old_status}, New Status: {new_status}, Current depart_time: {order.depart_time}, Current complete_time: {order.complete_time}"
+            logger.debug(
+                "update_dashboard entry: Order ID %s, Old Status: %s, New Status: %s, Current depart_time: %s, Current complete_time: %s",
+                dashboard_id,
+                old_status,
+                new_status,
+                order.depart_time,
+                order.complete_time,
             )
 
             # 시나리오 1: COMPLETE, ISSUE, CANCEL 상태들 간의 변경 (서로 다른 상태로 변경 시)
@@ -275,53 +280,65 @@ def update_dashboard(
                 and new_status in ["COMPLETE", "ISSUE", "CANCEL"]
                 and old_status != new_status
             ):
-                logger.info(
-                    f"DEBUG (update_dashboard): SCENARIO 1 - ({old_status} -> {new_status}) for order ID {dashboard_id}. Updating complete_time."
+                logger.debug(
+                    "update_dashboard: SCENARIO 1 - (%s -> %s) for order ID %s. Updating complete_time.",
+                    old_status,
+                    new_status,
+                    dashboard_id,
                 )
                 order.complete_time = now
 
             # 시나리오 2: WAITING -> IN_PROGRESS
             elif old_status == "WAITING" and new_status == "IN_PROGRESS":
-                logger.info(
-                    f"DEBUG (update_dashboard): SCENARIO 2 - WAITING -> IN_PROGRESS for order ID {dashboard_id}."
+                logger.debug(
+                    "update_dashboard: SCENARIO 2 - WAITING -> IN_PROGRESS for order ID %s.",
+                    dashboard_id,
                 )
                 order.depart_time = now
 
             # 시나리오 3: IN_PROGRESS -> COMPLETE
             elif old_status == "IN_PROGRESS" and new_status == "COMPLETE":
-                logger.info(
-                    f"DEBUG (update_dashboard): SCENARIO 3 - IN_PROGRESS -> COMPLETE for order ID {dashboard_id}."
+                logger.debug(
+                    "update_dashboard: SCENARIO 3 - IN_PROGRESS -> COMPLETE for order ID %s.",
+                    dashboard_id,
                 )
                 if order.depart_time is None:
-                    logger.info(
-                        f"DEBUG (update_dashboard): Correcting missing depart_time for order ID {dashboard_id} during IN_PROGRESS -> COMPLETE."
+                    logger.debug(
+                        "update_dashboard: Correcting missing depart_time for order ID %s during IN_PROGRESS -> COMPLETE.",
+                        dashboard_id,
                     )
                     order.depart_time = now
                 order.complete_time = now
 
             # 시나리오 4: IN_PROGRESS -> ISSUE 또는 CANCEL
             elif old_status == "IN_PROGRESS" and new_status in ["ISSUE", "CANCEL"]:
-                logger.info(
-                    f"DEBUG (update_dashboard): SCENARIO 4 - IN_PROGRESS -> {new_status} for order ID {dashboard_id}."
+                logger.debug(
+                    "update_dashboard: SCENARIO 4 - IN_PROGRESS -> %s for order ID %s.",
+                    new_status,
+                    dashboard_id,
                 )
                 if order.depart_time is None:
-                    logger.info(
-                        f"DEBUG (update_dashboard): Correcting missing depart_time for order ID {dashboard_id} during IN_PROGRESS -> {new_status}."
+                    logger.debug(
+                        "update_dashboard: Correcting missing depart_time for order ID %s during IN_PROGRESS -> %s.",
+                        dashboard_id,
+                        new_status,
                     )
                     order.depart_time = now
                 order.complete_time = now
 
             # 시나리오 5: COMPLETE -> IN_PROGRESS (역방향)
             elif old_status == "COMPLETE" and new_status == "IN_PROGRESS":
-                logger.info(
-                    f"DEBUG (update_dashboard): SCENARIO 5 - COMPLETE -> IN_PROGRESS for order ID {dashboard_id}."
+                logger.debug(
+                    "update_dashboard: SCENARIO 5 - COMPLETE -> IN_PROGRESS for order ID %s.",
+                    dashboard_id,
                 )
                 order.complete_time = None
 
             # 시나리오 6: IN_PROGRESS -> WAITING (역방향)
             elif old_status == "IN_PROGRESS" and new_status == "WAITING":
-                logger.info(
-                    f"DEBUG (update_dashboard): SCENARIO 6 - IN_PROGRESS -> WAITING for order ID {dashboard_id}."
+                logger.debug(
+                    "update_dashboard: SCENARIO 6 - IN_PROGRESS -> WAITING for order ID %s.",
+                    dashboard_id,
                 )
                 order.depart_time = None
                 order.complete_time = None
@@ -329,21 +346,28 @@ def update_dashboard(
             # 시나리오 7: ISSUE 또는 CANCEL 에서 WAITING 또는 IN_PROGRESS 로 변경
             elif old_status in ["ISSUE", "CANCEL"]:
                 if new_status == "WAITING":
-                    logger.info(
-                        f"DEBUG (update_dashboard): SCENARIO 7a - {old_status} -> WAITING for order ID {dashboard_id}."
+                    logger.debug(
+                        "update_dashboard: SCENARIO 7a - %s -> WAITING for order ID %s.",
+                        old_status,
+                        dashboard_id,
                     )
                     order.depart_time = None
                     order.complete_time = None
                 elif new_status == "IN_PROGRESS":
-                    logger.info(
-                        f"DEBUG (update_dashboard): SCENARIO 7b - {old_status} -> IN_PROGRESS for order ID {dashboard_id}."
+                    logger.debug(
+                        "update_dashboard: SCENARIO 7b - %s -> IN_PROGRESS for order ID %s.",
+                        old_status,
+                        dashboard_id,
                     )
                     order.depart_time = now
                     order.complete_time = None
 
             else:
                 logger.warning(
-                    f"DEBUG (update_dashboard): UNHANDLED or FALLTHROUGH status transition for order ID {dashboard_id} from {old_status} to {new_status}."
+                    "update_dashboard: UNHANDLED or FALLTHROUGH status transition for order ID %s from %s to %s.",
+                    dashboard_id,
+                    old_status,
+                    new_status,
                 )
 
         # 우편번호 변경 시 처리
@@ -389,6 +413,14 @@ def update_dashboard(
         )
 
 
+def _load_orders_by_id(db: Session, dashboard_ids: List[int]) -> Dict[int, Dashboard]:
+    """주문 ID 목록을 한 번의 IN 조회로 로드하여 ID별 딕셔너리로 반환"""
+    if not dashboard_ids:
+        return {}
+    orders = db.query(Dashboard).filter(Dashboard.dashboard_id.in_(dashboard_ids)).all()
+    return {order.dashboard_id: order for order in orders}
+
+
 def change_status(
     db: Session, dashboard_ids: List[int], new_status: str, user_id: str, user_role: str
 ) -> List[Dict[str, Any]]:
@@ -416,13 +448,12 @@ def change_status(
         "CANCEL": ["IN_PROGRESS", "COMPLETE", "ISSUE"],  # WAITING 제외
     }
 
+    # 대상 주문을 IN 조회 한 번으로 미리 로드 (ID별 개별 SELECT 제거)
+    orders_by_id = _load_orders_by_id(db, dashboard_ids)
+
     for dashboard_id in dashboard_ids:
         try:
-            order = (
-                db.query(Dashboard)
-                .filter(Dashboard.dashboard_id == dashboard_id)
-                .first()
-            )
+            order = orders_by_id.get(dashboard_id)
             if not order:
                 results.append(
                     {
@@ -502,8 +533,13 @@ def change_status(
                 "ISSUE",
                 "CANCEL",
             ]:
-                logger.info(
-                    f"DEBUG: Updating complete_time for order ID {order.dashboard_id} from {old_status} to {new_status}. Old complete_time: {order.complete_time}, New complete_time will be: {now}"
+                logger.debug(
+                    "Updating complete_time for order ID %s from %s to %s. Old complete_time: %s, New complete_time will be: %s",
+                    order.dashboard_id,
+                    old_status,
+                    new_status,
+                    order.complete_time,
+                    now,
                 )
                 # 이 블록에 진입 시 old_status != new_status 는 함수 상단에서 보장됨
                 order.complete_time = now
@@ -541,64 +577,84 @@ def change_status(
     return results
 
 
+# assign_driver에서 배송사 인자가 전달되지 않았음을 구분하기 위한 값
+_UNSET: Any = object()
+
+
 def assign_driver(
     db: Session,
     dashboard_ids: List[int],
     driver_name: str,
     driver_contact: Optional[str],
-    delivery_company: Optional[str],
+    *,
     user_id: str,
+    delivery_company: Optional[str] = _UNSET,
 ) -> List[Dict[str, Any]]:
-    """주문에 기사 및 배송사 배정"""
-    results = []
+    """
+    주문에 기사 및 배송사 배정 (대상 전체를 단일 UPDATE로 처리)
+    delivery_company를 넘기지 않으면 기존 배송사 값은 그대로 유지합니다.
+    """
+    if not dashboard_ids:
+        return []
     now = datetime.now()
-    for dashboard_id in dashboard_ids:
-        try:
-            order = (
-                db.query(Dashboard)
-                .filter(Dashboard.dashboard_id == dashboard_id)
-                .first()
-            )
-            if not order:
-                results.append(
-                    {
-                        "id": dashboard_id,
-                        "success": False,
-                        "message": "주문을 찾을 수 없습니다.",
-                    }
+    values: Dict[str, Any] = {
+        "driver_name": driver_name,
+        "driver_contact": driver_contact,
+        "update_by": user_id,
+        "update_at": now,
+        "version": Dashboard.version + 1,
+    }
+    if delivery_company is not _UNSET:
+        values["delivery_company"] = delivery_company
+    try:
+        result = db.execute(
+            update(Dashboard)
+            .where(Dashboard.dashboard_id.in_(dashboard_ids))
+            .values(**values)
+        )
+        # 일부만 반영된 경우에만 존재하는 ID를 조회하여 누락 항목 구분
+        target_ids = set(dashboard_ids)
+        if result.rowcount == len(target_ids):
+            found_ids = target_ids
+        else:
+            found_ids = set(
+                db.scalars(
+                    select(Dashboard.dashboard_id).where(
+                        Dashboard.dashboard_id.in_(target_ids)
+                    )
                 )
-                continue
-
-            order.driver_name = driver_name
-            order.driver_contact = driver_contact
-            order.delivery_company = delivery_company
-            order.update_by = user_id
-            order.update_at = now
-            order.version += 1
-
-            db.flush()
-            results.append(
-                {
-                    "id": dashboard_id,
-                    "success": True,
-                    "message": f"기사/배송사 배정 완료: {driver_name} ({delivery_company or '-'})",
-                }
-            )
-            logger.info(
-                f"주문 기사/배송사 배정 성공: ID {dashboard_id}, Driver {driver_name}, Company {delivery_company}"
-            )
-
-        except SQLAlchemyError as e:
-            db.rollback()
-            logger.error(
-                f"기사/배송사 배정 중 DB 오류: ID {dashboard_id}, {str(e)}",
-                exc_info=True,
             )
-            results.append(
-                {"id": dashboard_id, "success": False, "message": "데이터베이스 오류"}
-            )
-
-    return results
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(
+            f"기사/배송사 배정 중 DB 오류: IDs {dashboard_ids}, {str(e)}",
+            exc_info=True,
+        )
+        return [
+            {"id": dashboard_id, "success": False, "message": "데이터베이스 오류"}
+            for dashboard_id in dashboard_ids
+        ]
+
+    # 배송사 미전달(_UNSET) 시에도 표시용 문자열로 변환
+    company_label = (
+        "-" if delivery_company is _UNSET or not delivery_company else delivery_company
+    )
+    logger.info(
+        f"주문 기사/배송사 배정 성공: {len(found_ids)}건, Driver {driver_name}, Company {company_label}"
+    )
+    success_message = f"기사/배송사 배정 완료: {driver_name} ({company_label})"
+    return [
+        (
+            {"id": dashboard_id, "success": True, "message": success_message}
+            if dashboard_id in found_ids
+            else {
+                "id": dashboard_id,
+                "success": False,
+                "message": "주문을 찾을 수 없습니다.",
+            }
+        )
+        for dashboard_id in dashboard_ids
+    ]
 
 
 def delete_dashboard(
@@ -610,13 +666,12 @@ def delete_dashboard(
         logger.warning(f"주문 삭제 권한 없음: 사용자 {user_id}")
         return [{"success": False, "message": "삭제 권한이 없습니다."}]
 
+    # 대상 주문을 IN 조회 한 번으로 미리 로드 (ID별 개별 SELECT 제거)
+    orders_by_id = _load_orders_by_id(db, dashboard_ids)
+
     for dashboard_id in dashboard_ids:
         try:
-            order = (
-                db.query(Dashboard)
-                .filter(Dashboard.dashboard_id == dashboard_id)
-                .first()
-            )
+            order = orders_by_id.get(dashboard_id)
             if not order:
                 results.append(
                     {
@@ -5,18 +5,38 @@
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from sqlalchemy import bindparam, delete, desc, func, insert, select, update
 from fastapi import HTTPException, status
 import logging
 from main.models.handover_model import Handover
 from main.models.user_model import User
-from main.utils.pagination import paginate_query
+from main.utils.pagination import build_pagination
 
 logger = logging.getLogger(__name__)
 
+# 목록 조회 구문은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 재사용
+# (요청마다 Query 빌드/캐시 키 생성 비용 제거, 컴파일 결과는 엔진 캐시에서 재사용)
+_HANDOVER_COUNT_STMT = (
+    select(func.count())
+    .select_from(Handover)
+    .where(Handover.is_notice == bindparam("is_notice"))
+)
+# 전체 건수는 COUNT(*) OVER () 로 페이지 조회와 같은 쿼리에서 함께 가져옴
+_HANDOVER_PAGE_STMT = (
+    select(Handover, func.count().over().label("total"))
+    .options(joinedload(Handover.creator), joinedload(Handover.updater))
+    .where(Handover.is_notice == bindparam("is_notice"))
+    .order_by(desc(Handover.update_at))
+    .limit(bindparam("lim"))
+    .offset(bindparam("off"))
+)
+
 
 def _handover_to_dict(handover: Handover) -> Dict[str, Any]:
-    """Handover 모델 객체를 API 응답용 딕셔너리로 변환 (ISO 8601 형식 사용)"""
+    """Handover 모델 객체를 API 응답용 딕셔너리로 변환
+
+    datetime 값은 그대로 두고 직렬화 단계(ORJSONResponse / 템플릿 필터)에서 처리
+    """
 
     # 관계(relationship)를 통해 로드된 사용자 이름 사용
     creator_name = handover.creator.user_name if handover.creator else None
@@ -30,11 +50,9 @@ def _handover_to_dict(handover: Handover) -> Dict[str, Any]:
         "department": handover.department,
         "create_by": handover.create_by,
         "creator_name": creator_name,
-        "create_time": (
-            handover.create_time.isoformat() if handover.create_time else None
-        ),
+        "create_time": handover.create_time,
         "update_by": handover.update_by,
-        "update_at": handover.update_at.isoformat() if handover.update_at else None,
+        "update_at": handover.update_at,
         "status": handover.status,
         "version": handover.version,
     }
@@ -48,10 +66,30 @@ def get_handover_list_paginated(
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """페이지네이션된 인수인계/공지 목록 조회"""
     try:
-        query = db.query(Handover).filter(Handover.is_notice == is_notice)
-        handovers_raw, pagination_info = paginate_query(
-            query.order_by(desc(Handover.update_at)), page, page_size
-        )
+        page = max(page, 1)
+        params = {
+            "is_notice": is_notice,
+            "lim": page_size,
+            "off": (page - 1) * page_size,
+        }
+        rows = db.execute(_HANDOVER_PAGE_STMT, params).unique().all()
+
+        if rows:
+            total_items = rows[0].total
+        elif page > 1:
+            # 범위를 벗어난 페이지 요청 시에만 건수를 따로 조회하여 마지막 페이지로 조정
+            total_items = db.execute(
+                _HANDOVER_COUNT_STMT, {"is_notice": is_notice}
+            ).scalar_one()
+        else:
+            total_items = 0
+
+        pagination_info = build_pagination(total_items, page, page_size)
+        if not rows and total_items > 0:
+            params["off"] = (pagination_info["current_page"] - 1) * page_size
+            rows = db.execute(_HANDOVER_PAGE_STMT, params).unique().all()
+
+        handovers_raw = [row.Handover for row in rows]
         # 모델 객체 리스트를 딕셔너리 리스트로 변환
         handover_list = [_handover_to_dict(h) for h in handovers_raw]
         return handover_list, pagination_info
@@ -91,9 +129,12 @@ def get_notice_list(
 
 
 def get_handover_by_id(db: Session, handover_id: int) -> Optional[Handover]:
-    """ID로 인수인계 상세 조회 (모델 객체 반환)"""
+    """ID로 인수인계 상세 조회 (모델 객체 반환)
+
+    세션 identity map에 이미 로드된 경우 SQL 없이 반환됨
+    """
     try:
-        return db.query(Handover).filter(Handover.handover_id == handover_id).first()
+        return db.get(Handover, handover_id)
     except Exception as e:
         logger.error(f"ID로 상세 조회 오류 ({handover_id}): {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="데이터 조회 중 오류 발생")
@@ -129,69 +170,122 @@ def create_handover(
         raise HTTPException(status_code=500, detail="인수인계 생성 중 오류 발생")
 
 
+def bulk_create_handovers(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """인수인계 일괄 생성 (ORM unit-of-work를 거치지 않는 단일 다중 INSERT)
+
+    rows 항목은 title, content, create_by 필수 / is_notice, department, update_by 선택
+    """
+    if not rows:
+        return 0
+    logger.info(f"인수인계 일괄 생성 요청: {len(rows)}건")
+    try:
+        # is_notice/department/update_at 은 컬럼 default 로 채워짐
+        values = [{"update_by": row["create_by"], **row} for row in rows]
+        db.execute(insert(Handover), values)
+        logger.info(f"인수인계 일괄 생성 완료 (커밋 전): {len(values)}건")
+        return len(values)
+    except Exception as e:
+        logger.error(f"인수인계 일괄 생성 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="인수인계 일괄 생성 중 오류 발생")
+
+
+def bulk_close_handovers(db: Session, ids: List[int], updated_by: str) -> int:
+    """인수인계 일괄 종료 (단일 UPDATE로 상태 변경 및 버전 증가)"""
+    if not ids:
+        return 0
+    logger.info(f"인수인계 일괄 종료 요청: {len(ids)}건, 요청자={updated_by}")
+    try:
+        result = db.execute(
+            update(Handover)
+            .where(Handover.handover_id.in_(ids))
+            .values(
+                status="CLOSE",
+                update_by=updated_by,
+                update_at=datetime.now(),
+                version=Handover.version + 1,
+            )
+        )
+        logger.info(f"인수인계 일괄 종료 완료 (커밋 전): {result.rowcount}건")
+        return result.rowcount
+    except Exception as e:
+        logger.error(f"인수인계 일괄 종료 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="인수인계 일괄 종료 중 오류 발생")
+
+
 def update_handover(
     db: Session,
     handover_id: int,
     update_data: Dict[str, Any],  # 수정할 데이터 딕셔너리
     updated_by: str,
     user_role: str,  # 권한 확인용
+    expected_version: Optional[int] = None,  # 조회 시점 버전 (동시 수정 감지용)
 ) -> Handover:
-    """인수인계 수정 (락 점검 및 권한 확인 포함)"""
+    """인수인계 수정 (권한/버전 조건을 UPDATE WHERE 절에 포함하여 단일 쿼리로 처리)"""
     try:
-        handover = get_handover_by_id(db, handover_id)
-        if not handover:
+        # 유효한 상태 값인지 확인
+        new_status = update_data.get("status")
+        if new_status is not None and new_status not in ["OPEN", "CLOSE"]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 상태 값입니다 (OPEN 또는 CLOSE).",
+            )
+
+        stmt = update(Handover).where(Handover.handover_id == handover_id)
+        is_notice_new = update_data.get("is_notice")
+        if user_role != "ADMIN":
+            # 수정/상태 변경 권한 (작성자만), 공지사항 여부 변경은 ADMIN만 가능
+            stmt = stmt.where(Handover.create_by == updated_by)
+            if is_notice_new is not None:
+                stmt = stmt.where(Handover.is_notice == is_notice_new)
+        if expected_version is not None:
+            stmt = stmt.where(Handover.version == expected_version)
+
+        result = db.execute(
+            stmt.values(
+                **update_data,
+                update_at=datetime.now(),
+                update_by=updated_by,
+                version=Handover.version + 1,
+            )
+        )
+        if result.rowcount == 1:
+            logger.info(f"인수인계 수정 완료 (커밋 전): ID {handover_id}")
+            # 세션에 로드된 객체는 UPDATE 시 동기화되므로 추가 조회 없이 반환
+            return db.get(Handover, handover_id)
+
+        # 수정되지 않은 경우에만 현재 행을 조회하여 404/403/409 구분
+        current = (
+            db.query(Handover.create_by, Handover.is_notice, Handover.version)
+            .filter(Handover.handover_id == handover_id)
+            .first()
+        )
+        if current is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="수정할 인수인계를 찾을 수 없습니다.",
             )
-
-        # 2. 수정 권한 확인 (작성자 또는 ADMIN)
-        if handover.create_by != updated_by and user_role != "ADMIN":
+        if user_role != "ADMIN" and current.create_by != updated_by:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="이 인수인계를 수정할 권한이 없습니다.",
             )
-
-        # 3. 공지사항 변경 권한 확인 (ADMIN만 가능)
-        is_notice_new = update_data.get("is_notice")
         if (
-            is_notice_new is not None
-            and is_notice_new != handover.is_notice
-            and user_role != "ADMIN"
+            user_role != "ADMIN"
+            and is_notice_new is not None
+            and current.is_notice != is_notice_new
         ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="관리자만 공지사항 여부를 변경할 수 있습니다.",
             )
+        logger.warning(f"인수인계 동시 수정 충돌: ID {handover_id}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="다른 사용자가 먼저 수정했습니다. 새로고침 후 다시 시도해주세요.",
+        )
 
-        # status 필드 처리 및 권한 확인 (작성자 또는 ADMIN만 변경 가능)
-        new_status = update_data.get("status")
-        if new_status is not None and new_status != handover.status:
-            if handover.create_by != updated_by and user_role != "ADMIN":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="인수인계 상태는 작성자 또는 관리자만 변경할 수 있습니다.",
-                )
-            # 유효한 상태 값인지 확인 (선택적)
-            if new_status not in ["OPEN", "CLOSE"]:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="유효하지 않은 상태 값입니다 (OPEN 또는 CLOSE).",
-                )
-
-        # 4. 필드 업데이트 적용
-        for key, value in update_data.items():
-            setattr(handover, key, value)
-
-        # 공통 업데이트 정보
-        handover.update_at = datetime.now()
-        handover.update_by = updated_by
-        handover.version += 1  # 버전 1 증가
-
-        db.flush()  # 변경사항 반영
-        logger.info(f"인수인계 수정 완료 (커밋 전): ID {handover.handover_id}")
-        return handover
-
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"인수인계 수정 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="인수인계 수정 중 오류 발생")
@@ -200,26 +294,34 @@ def update_handover(
 def delete_handover(
     db: Session, handover_id: int, user_id: str, user_role: str
 ) -> bool:
-    """인수인계 삭제 (락 점검 및 권한 확인 포함)"""
+    """인수인계 삭제 (권한 조건을 DELETE WHERE 절에 포함하여 단일 쿼리로 처리)"""
     try:
-        handover = get_handover_by_id(db, handover_id)
-        if not handover:
-            # 락 확인 후 객체가 사라진 경우 (매우 드묾)
-            logger.warning(f"삭제할 인수인계({handover_id}) 찾을 수 없음 (락 확인 후)")
-            # 실패로 처리하거나, 이미 삭제된 것으로 간주하고 성공 처리 가능
-            return False  # 실패로 처리
+        stmt = delete(Handover).where(Handover.handover_id == handover_id)
+        # 삭제 권한 확인 (작성자 또는 ADMIN)
+        if user_role != "ADMIN":
+            stmt = stmt.where(Handover.create_by == user_id)
 
-        # 2. 삭제 권한 확인 (작성자 또는 ADMIN)
-        if handover.create_by != user_id and user_role != "ADMIN":
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="이 인수인계를 삭제할 권한이 없습니다.",
-            )
+        result = db.execute(stmt)
+        if result.rowcount == 1:
+            logger.info(f"인수인계 삭제 완료 (커밋 전): ID {handover_id}")
+            return True
 
-        db.delete(handover)
-        db.flush()
-        logger.info(f"인수인계 삭제 완료 (커밋 전): ID {handover_id}")
-        return True
+        # 삭제되지 않은 경우에만 존재 여부를 조회하여 404/403 구분
+        create_by = (
+            db.query(Handover.create_by)
+            .filter(Handover.handover_id == handover_id)
+            .scalar()
+        )
+        if create_by is None:
+            logger.warning(f"삭제할 인수인계({handover_id}) 찾을 수 없음")
+            return False  # 실패로 처리
+
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 인수인계를 삭제할 권한이 없습니다.",
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"인수인계 삭제 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="인수인계 삭제 중 오류 발생")
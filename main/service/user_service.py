@@ -12,6 +12,11 @@ logger = logging.getLogger(__name__)  # 로거 인스턴스 생성
 from main.models.user_model import User
 
 
+def _escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자(\\, %, _) 이스케이프"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 def get_user_list(
     db: Session,
     page: int = 1,
@@ -33,9 +38,13 @@ def get_user_list(
 
         if search_type and search_value:
             if search_type == "user_id":
-                query = query.filter(User.user_id.like(f"%{search_value}%"))
+                # 전방 일치 검색 - 선행 와일드카드가 없어 PK 인덱스 범위 스캔 사용
+                query = query.filter(
+                    User.user_id.like(f"{_escape_like(search_value)}%", escape="\\")
+                )
             elif search_type == "user_department":
-                query = query.filter(User.user_department.like(f"%{search_value}%"))
+                # 부서는 ENUM(CS/HES/LENOVO)이므로 정확히 일치 비교
+                query = query.filter(User.user_department == search_value.upper())
 
         # 전체 건수 조회
         total = query.count()
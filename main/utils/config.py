@@ -7,7 +7,7 @@ import time
 from typing import List, Dict, Any
 from functools import lru_cache
 import logging
-import urllib.parse  # URL 인코딩을 위해 추가
+from sqlalchemy.engine import URL
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -21,6 +21,16 @@ except AttributeError:
     pass
 
 
+def _default_db_driver() -> str:
+    """C 확장 드라이버(mysqlclient)가 설치되어 있으면 우선 사용, 없으면 pymysql"""
+    try:
+        import MySQLdb  # noqa: F401
+
+        return "mysqldb"
+    except ImportError:
+        return "pymysql"
+
+
 def parse_comma_separated_list(value: str) -> List[str]:
     """콤마로 구분된 문자열을 리스트로 변환"""
     if not value:
@@ -33,6 +43,7 @@ class Settings:
 
     def __init__(self):
         # 서버 설정
+        self.ENV = os.getenv("ENV", "prod")  # 실행 환경 (prod / dev 등)
         self.DEBUG = False  # 프로덕션 환경에서는 항상 False
         self.PORT = int(os.getenv("PORT", "8080"))
         self.LOG_LEVEL = "INFO"  # 프로덕션 환경에서 기본 로그 레벨
@@ -48,6 +59,19 @@ class Settings:
         self.MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "teckwah0206")
         self.MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "delivery_system")
         self.MYSQL_CHARSET = os.getenv("MYSQL_CHARSET", "utf8mb4")
+        # DB 드라이버 (mysqldb: C 확장, pymysql: 순수 Python) - DB_DRIVER로 강제 가능
+        self.DB_DRIVER = os.getenv("DB_DRIVER") or _default_db_driver()
+
+        # 커넥션 풀 설정
+        # pool_pre_ping은 체크아웃마다 왕복 1회가 추가되므로 기본 비활성화
+        # (pool_recycle을 Cloud SQL wait_timeout(8h)보다 충분히 짧게 유지)
+        self.DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+        self.DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        # 기존 pool_size=5, max_overflow=10 설정에서는 동시 요청이 몰릴 때
+        # "QueuePool limit of size 5 overflow 10 reached, connection timed out" 오류로
+        # 요청이 멈추는 문제가 있어 기본값을 상향 (0이면 CPU 수 기준으로 자동 계산)
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "0"))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
 
         # 인증 설정
         self.SESSION_SECRET = os.getenv(
@@ -55,66 +79,44 @@ class Settings:
             "bbdcf8bf3de489b385cc6307ce420ad563ba4848c201fa9d003cdb4efdab42da",
         )
         self.SESSION_EXPIRE_HOURS = int(os.getenv("SESSION_EXPIRE_HOURS", "24"))
+        # 신규 비밀번호 해시의 bcrypt cost (기존 해시는 저장된 cost로 그대로 검증됨)
+        self.BCRYPT_COST = int(os.getenv("BCRYPT_COST", "12"))
+
+        # DB 연결 URL - 접근할 때마다 다시 만들지 않도록 1회만 생성
+        # URL.create가 계정 정보의 예약 문자(@, :, /, #, 공백)를 올바르게 인코딩
+        self.DATABASE_URL = self._build_database_url()
+        # 로그 출력용 (비밀번호 마스킹)
+        self.SAFE_DATABASE_URL = self.DATABASE_URL.render_as_string(hide_password=True)
+
+        # 설정 로드 로그 - 워커마다 반복 출력되므로 CONFIG_DEBUG=1 일 때만 1회 출력
+        if os.getenv("CONFIG_DEBUG", "0") == "1":
+            logger.info(
+                "=== GAE 프로덕션 애플리케이션 설정 로드 ===\n"
+                f"DEBUG: {self.DEBUG}\n"
+                f"PORT: {self.PORT}\n"
+                f"ALLOWED_ORIGINS: {self.ALLOWED_ORIGINS}\n"
+                f"MYSQL_HOST: {self.MYSQL_HOST}\n"
+                f"MYSQL_DATABASE: {self.MYSQL_DATABASE}\n"
+                f"MYSQL_USER: {self.MYSQL_USER}\n"
+                f"MYSQL_PASSWORD 설정 여부: {'YES' if self.MYSQL_PASSWORD else 'NO'}\n"
+                f"생성된 DB 연결 URL(마스킹됨): {self.SAFE_DATABASE_URL}\n"
+                "============================="
+            )
 
-        # 설정 로드 로그
-        logger.info("=== GAE 프로덕션 애플리케이션 설정 로드 ===")
-        logger.info(f"DEBUG: {self.DEBUG}")
-        logger.info(f"PORT: {self.PORT}")
-        logger.info(f"ALLOWED_ORIGINS: {self.ALLOWED_ORIGINS}")
-        logger.info(f"MYSQL_HOST: {self.MYSQL_HOST}")
-        logger.info(f"MYSQL_DATABASE: {self.MYSQL_DATABASE}")
-        logger.info(f"MYSQL_USER: {self.MYSQL_USER}")
-        logger.info(
-            f"MYSQL_PASSWORD 설정 여부: {'YES' if self.MYSQL_PASSWORD else 'NO'}"
-        )
-        logger.info("=============================")
-
-    # DB 연결 문자열 - GAE 프로덕션 환경 전용
-    # 로깅 중복 방지용 플래그
-    _db_url_logged = False
-
-    @property
-    def DATABASE_URL(self) -> str:
+    def _build_database_url(self) -> URL:
         """
         데이터베이스 연결 URL 생성
         명시적인 IP 주소를 사용하여 DNS 관련 문제 방지
         """
-        # 사용자 이름과 비밀번호 URL 인코딩
-        try:
-            # 기본 연결 방식 사용 (URL 인코딩 없이 시도)
-            user = self.MYSQL_USER
-            password = self.MYSQL_PASSWORD
-            # 명시적 IP 주소 사용 (DNS 대신)
-            host = self.MYSQL_HOST  # 현재 10.54.192.10
-
-            # 로깅은 최초 1회만 수행
-            if not Settings._db_url_logged:
-                # 디버깅을 위한 로깅 추가
-                logger.info(f"DB 연결 정보 - MYSQL_USER: '{user}'")
-                logger.info(
-                    f"DB 연결 정보 - MYSQL_PASSWORD 설정 여부: {'YES' if password else 'NO'}"
-                )
-                logger.info(f"DB 연결 정보 - MYSQL_HOST: '{host}' (명시적 IP 사용)")
-
-                # 마스킹된 URL 로깅
-                masked_url = f"mysql+pymysql://{user}:{'*****'}@{host}/{self.MYSQL_DATABASE}?charset={self.MYSQL_CHARSET}"
-                logger.info(f"생성된 DB 연결 URL(마스킹됨): {masked_url}")
-                Settings._db_url_logged = True
-
-            # 단순화된 연결 문자열
-            return f"mysql+pymysql://{user}:{password}@{host}/{self.MYSQL_DATABASE}?charset={self.MYSQL_CHARSET}"
-        except Exception as e:
-            # 예외 발생시 상세 로깅
-            logger.error(f"DB 연결 URL 생성 중 오류 발생: {str(e)}")
-            # 환경 변수 직접 로깅
-            logger.error(
-                f"환경변수 직접 확인 - MYSQL_USER: '{os.getenv('MYSQL_USER', '')}'"
-            )
-            logger.error(
-                f"환경변수 직접 확인 - MYSQL_HOST: '{os.getenv('MYSQL_HOST', '')}'"
-            )
-            # 기본값으로 재시도
-            return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}/{self.MYSQL_DATABASE}?charset={self.MYSQL_CHARSET}"
+        return URL.create(
+            drivername=f"mysql+{self.DB_DRIVER}",
+            username=self.MYSQL_USER,
+            password=self.MYSQL_PASSWORD,
+            host=self.MYSQL_HOST,
+            port=self.MYSQL_PORT,
+            database=self.MYSQL_DATABASE,
+            query={"charset": self.MYSQL_CHARSET},
+        )
 
 
 @lru_cache()
@@ -2,16 +2,20 @@
 데이터베이스 연결 설정
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, Optional, Dict
+from contextvars import ContextVar, Token
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from fastapi import Depends
 import os
+import pymysql
 
 from main.utils.config import get_settings
+from main.utils.diagnostics.db_connection import is_app_engine
 
 settings = get_settings()
 
@@ -22,37 +26,104 @@ _connection_logged = False
 
 def log_db_connection_info():
     global _connection_logged
-    if not _connection_logged:
-        logger.info("=== 데이터베이스 설정 확인 ===")
-        logger.info(f"MYSQL_HOST: {settings.MYSQL_HOST}")
-        logger.info(f"MYSQL_PORT: {settings.MYSQL_PORT}")
-        logger.info(f"MYSQL_DATABASE: {settings.MYSQL_DATABASE}")
-        logger.info(f"GAE_ENV: {os.getenv('GAE_ENV', '없음')}")
+    # 프로덕션에서는 호스트 정보가 로그 수집기로 넘어가지 않도록 출력하지 않음
+    if not _connection_logged and settings.ENV != "prod":
         logger.info(
-            f"연결 URL 패턴: mysql+pymysql://[user]@{settings.MYSQL_HOST}{'/' if os.getenv('GAE_ENV', '').startswith('standard') else ':' + str(settings.MYSQL_PORT) + '/'}{settings.MYSQL_DATABASE}"
+            f"DB 설정: {settings.SAFE_DATABASE_URL} (App Engine: {is_app_engine()})"
         )
-        logger.info("===========================")
-        _connection_logged = True
-
-# 최초 1회 로깅
-log_db_connection_info()
-
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # 연결 유효성 검사
-    pool_recycle=3600,  # 1시간마다 연결 재활용
-    pool_size=5,  # 연결 풀 크기
-    max_overflow=10,  # 최대 초과 연결 수
-)
+    _connection_logged = True
+
+# 테스트 등에서 주입한 엔진 (override_engine 참고)
+_engine_override: Optional[Engine] = None
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    SQLAlchemy 엔진 싱글톤 반환 (최초 사용 시 생성)
+    import 시점에는 커넥션 풀을 만들지 않음
+    """
+    if _engine_override is not None:
+        return _engine_override
+
+    # 최초 1회 로깅
+    log_db_connection_info()
+
+    # 커넥션 풀 크기 결정 (DB_POOL_SIZE=0 이면 CPU 수 기준 자동 계산)
+    pool_size = settings.DB_POOL_SIZE or max(10, (os.cpu_count() or 2) * 5)
+    logger.info(
+        f"DB 커넥션 풀: pool_size={pool_size}, max_overflow={settings.DB_MAX_OVERFLOW}"
+    )
+
+    return create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,  # 연결 유효성 검사 (기본 비활성화)
+        pool_recycle=settings.DB_POOL_RECYCLE,  # 주기적 연결 재활용
+        pool_size=pool_size,  # 연결 풀 크기
+        max_overflow=settings.DB_MAX_OVERFLOW,  # 최대 초과 연결 수
+        # 응답 없는 연결이 풀 슬롯을 오래 점유하지 않도록 타임아웃 지정
+        connect_args={"connect_timeout": 5, "read_timeout": 30, "write_timeout": 30},
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    """세션 팩토리 싱글톤 반환 (최초 사용 시 생성)"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def override_engine(new_engine: Optional[Engine]) -> None:
+    """
+    엔진 교체 (테스트용 엔진 주입 등)
+    None을 전달하면 설정 기반 기본 엔진으로 복귀
+    """
+    global _engine_override
+    _engine_override = new_engine
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
 
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # 베이스 모델 생성
 Base = declarative_base()
 
 
+# 요청 단위 세션 저장소 (DBSessionMiddleware가 요청마다 빈 dict를 설정)
+# call_next/스레드풀로 컨텍스트가 복사되어도 같은 dict를 공유하도록 세션 대신 dict를 보관
+_request_session: ContextVar[Optional[Dict[str, Session]]] = ContextVar(
+    "_request_session", default=None
+)
+
+
+def begin_request_scope() -> Token:
+    """요청 단위 세션 범위 시작 (미들웨어에서 호출)"""
+    return _request_session.set({})
+
+
+def get_request_session() -> Optional[Session]:
+    """
+    현재 요청의 세션 반환 (최초 호출 시 생성)
+    요청 범위 밖(미들웨어 미적용)에서는 None 반환
+    """
+    scope = _request_session.get()
+    if scope is None:
+        return None
+    db = scope.get("db")
+    if db is None:
+        db = get_session_factory()()
+        scope["db"] = db
+    return db
+
+
+def close_request_session(token: Token) -> None:
+    """요청 단위 세션 종료 및 범위 해제 (미들웨어에서 호출)"""
+    scope = _request_session.get()
+    try:
+        if scope and "db" in scope:
+            scope.pop("db").close()
+    finally:
+        _request_session.reset(token)
+
+
 # 데이터베이스 연결 테스트 (최초 1회만 실행되도록)
 _db_connection_tested = False
 
@@ -66,75 +137,64 @@ def test_db_connection():
         logger.debug("데이터베이스 연결 테스트 이미 수행됨. 중복 실행 방지.")
         return True
     
-    from sqlalchemy import text
-    import socket
+    # 로그는 목록에 모아 한 번에 출력 (Cloud Logging에서 하나의 항목으로 묶임)
+    is_gae = is_app_engine()
+    lines = [
+        "=" * 53,
+        "데이터베이스 연결 테스트 시작...",
+        f"환경: {'GAE 프로덕션' if is_gae else '로컬/개발'}",
+        f"연결 대상: {settings.MYSQL_HOST}:{settings.MYSQL_PORT}",
+        f"데이터베이스: {settings.MYSQL_DATABASE}",
+    ]
 
     try:
-        logger.info("=====================================================")
-        logger.info("데이터베이스 연결 테스트 시작...")
-
-        # 환경 정보 로깅
-        is_gae = os.getenv("GAE_ENV", "").startswith("standard")
-        logger.info(f"환경: {'GAE 프로덕션' if is_gae else '로컬/개발'}")
-        
-        # 상세 연결 정보 로깅 (축소)
-        logger.info(f"연결 대상: {settings.MYSQL_HOST}:{settings.MYSQL_PORT}")
-        logger.info(f"데이터베이스: {settings.MYSQL_DATABASE}")
-
-        # 실제 데이터베이스 연결 시도 (간소화된 로직)
-        logger.info("데이터베이스 연결 시도...")
-        try:
-            # 직접 pymysql로 연결 시도 (저수준)
-            import pymysql
-            conn = pymysql.connect(
-                host=settings.MYSQL_HOST,
-                user=settings.MYSQL_USER,
-                password=settings.MYSQL_PASSWORD,
-                database=settings.MYSQL_DATABASE,
-                port=settings.MYSQL_PORT,
-                connect_timeout=5,
-                charset='utf8mb4'
-            )
-            
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT VERSION()")
-                version = cursor.fetchone()[0]
-                cursor.execute("SELECT CURRENT_USER()")
-                current_user = cursor.fetchone()[0]
-            
-            logger.info(f"데이터베이스 직접 연결 성공!")
-            logger.info(f"MySQL 버전: {version}")
-            logger.info(f"연결된 사용자: {current_user}")
-            conn.close()
-            
-            # SQLAlchemy 연결도 확인
-            with engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                sqlalchemy_result = result.fetchone()[0]
-                
-            logger.info(f"SQLAlchemy 연결 성공: {sqlalchemy_result}")
-            logger.info("=====================================================")
-            
-            _db_connection_tested = True
-            return True
-        except Exception as direct_err:
-            logger.error(f"직접 연결 실패: {str(direct_err)}")
-            raise
-            
+        # 직접 pymysql로 연결 시도 (저수준)
+        conn = pymysql.connect(
+            host=settings.MYSQL_HOST,
+            user=settings.MYSQL_USER,
+            password=settings.MYSQL_PASSWORD,
+            database=settings.MYSQL_DATABASE,
+            port=settings.MYSQL_PORT,
+            connect_timeout=5,
+            charset='utf8mb4'
+        )
+
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT VERSION()")
+            version = cursor.fetchone()[0]
+            cursor.execute("SELECT CURRENT_USER()")
+            current_user = cursor.fetchone()[0]
+        conn.close()
+        lines.append("데이터베이스 직접 연결 성공!")
+        lines.append(f"MySQL 버전: {version}")
+        lines.append(f"연결된 사용자: {current_user}")
+
+        # SQLAlchemy 연결도 확인
+        with get_engine().connect() as conn:
+            result = conn.execute(text("SELECT 1"))
+            sqlalchemy_result = result.fetchone()[0]
+
+        lines.append(f"SQLAlchemy 연결 성공: {sqlalchemy_result}")
+        lines.append("=" * 53)
+        logger.info("\n".join(lines))
+
+        _db_connection_tested = True
+        return True
+
     except Exception as e:
-        logger.error("=====================================================")
-        logger.error(f"데이터베이스 연결 실패: {str(e)}")
+        lines.append(f"데이터베이스 연결 실패: {str(e)}")
 
         # 간단한 오류 메시지 (축소됨)
         error_msg = str(e).lower()
         if "access denied" in error_msg:
-            logger.error("원인: MySQL 사용자 접근 권한 문제")
+            lines.append("원인: MySQL 사용자 접근 권한 문제")
         elif "connect" in error_msg and "timeout" in error_msg:
-            logger.error("원인: 연결 타임아웃 - 방화벽 또는 VPC 설정 확인 필요")
+            lines.append("원인: 연결 타임아웃 - 방화벽 또는 VPC 설정 확인 필요")
         elif "unknown host" in error_msg:
-            logger.error("원인: 알 수 없는 호스트 - IP 주소가 올바른지 확인하세요")
-        
-        logger.error("=====================================================")
+            lines.append("원인: 알 수 없는 호스트 - IP 주소가 올바른지 확인하세요")
+
+        lines.append("=" * 53)
+        logger.error("\n".join(lines))
 
         _db_connection_tested = True  # 실패해도 중복 실행 방지를 위해 플래그 설정
         return False
@@ -150,41 +210,38 @@ def get_db() -> Generator[Session, None, None]:
     """
     데이터베이스 세션 의존성 함수
     세션을 자동으로 닫고 예외 발생 시 롤백 처리
+    커밋은 하지 않음 - 변경이 있는 경로는 db_transaction 또는 명시적 commit 사용
     """
-    import uuid
+    # 요청 범위 세션이 있으면 재사용 (종료는 DBSessionMiddleware가 담당)
+    db = get_request_session()
+    request_scoped = db is not None
+    if not request_scoped:
+        db = get_session_factory()()
 
-    # 각 세션 요청에 고유 ID 부여하여 추적
-    session_id = str(uuid.uuid4())[:8]
-    # DEBUG 레벨로 변경하여 일반 INFO 로그에서는 표시되지 않게 함
-    logger.debug(f"DB 세션 시작 [세션ID: {session_id}]")
-
-    db = SessionLocal()
+    # 세션 추적 ID는 id(db) 하위 16비트 사용 (난수 생성/문자열 변환 없음)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DB 세션 [세션ID: %04x]", id(db) & 0xFFFF)
     try:
-        logger.debug(f"DB 세션 생성 완료 [세션ID: {session_id}]") 
         yield db
-        db.commit()
-        logger.debug(f"DB 트랜잭션 커밋 완료 [세션ID: {session_id}]")
     except Exception as e:
         db.rollback()
-        # 오류는 여전히 ERROR 레벨로 로깅
-        logger.error(f"DB 트랜잭션 롤백: {str(e)} [세션ID: {session_id}]")
-        # 오류 세부 정보 기록
-        import traceback
-
+        # 트레이스백은 핸들러가 실제로 출력할 때만 포맷됨
         logger.error(
-            f"DB 오류 상세 내용: {traceback.format_exc()} [세션ID: {session_id}]"
+            "DB 트랜잭션 롤백 [세션ID: %04x]: %s", id(db) & 0xFFFF, e, exc_info=True
         )
         raise
     finally:
-        db.close()
-        logger.debug(f"DB 세션 종료 [세션ID: {session_id}]")
+        if not request_scoped:
+            db.close()
 
 
 # 트랜잭션 관리 데코레이터
 def db_transaction(func):
     """
     API 엔드포인트 함수에 적용하여 DB 트랜잭션을 자동으로 관리하는 데코레이터.
-    함수 실행 성공 시 커밋, 예외 발생 시 롤백.
+    함수 실행 성공 시 커밋, 예외 발생 시 롤백 (요청당 커밋은 여기서 1회만 수행).
+    서비스 함수가 내부에서 db.rollback()을 호출하는 경우가 있어
+    `with db.begin()` 대신 명시적 commit/rollback을 사용.
     `db: Session = Depends(get_db)` 파라미터를 함수 시그니처에 포함해야 함.
     """
 
@@ -13,13 +13,48 @@ from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-# 단 한 번만 실행되도록 캐싱
+
+def is_app_engine() -> bool:
+    """
+    App Engine 환경 여부 (환경 감지는 모두 이 함수 사용)
+    GAE_ENV는 Standard에서만 설정되므로, Flexible에서도 설정되는 GAE_INSTANCE로 판단
+    """
+    return bool(os.getenv("GAE_INSTANCE"))
+
+
 @lru_cache(maxsize=1)
+def get_local_ip() -> str:
+    """
+    현재 인스턴스의 내부 IP (프로세스당 1회만 조회)
+    App Engine에서는 블로킹 DNS 조회를 하지 않고 인스턴스 ID를 반환
+    """
+    if is_app_engine():
+        return f"GAE 인스턴스 {os.getenv('GAE_INSTANCE')}"
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except (socket.gaierror, socket.herror) as e:
+        logger.warning(f"로컬 IP 조회 실패: {str(e)}")
+        return "확인 불가"
+
+
+# 프로세스당 1회만 실행되도록 플래그로 관리
+_diagnosed = False
+
+
 def diagnose_db_connection():
     """
-    데이터베이스 연결 진단 - 최초 1회만 실행
+    데이터베이스 연결 진단 - 프로세스당 최초 1회만 실행
     TCP 소켓 연결 및 실제 MySQL 연결 테스트 수행
+    SKIP_DB_DIAGNOSTIC 환경 변수가 설정되어 있으면 생략
     """
+    global _diagnosed
+    if _diagnosed or os.getenv("SKIP_DB_DIAGNOSTIC"):
+        return True
+    _diagnosed = True
+
+    # 로그는 목록에 모아 진단 종료 시 한 번에 출력 (로그 접두어로 필터링 가능)
+    lines = []
+    success = False
     try:
         from main.utils.config import get_settings
         settings = get_settings()
@@ -31,25 +66,32 @@ def diagnose_db_connection():
         database = settings.MYSQL_DATABASE
         port = settings.MYSQL_PORT
         
-        # 로그 접두어로 쉽게 필터링 가능하게 함
-        logger.info(f"[DB진단] 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"[DB진단] GAE -> Cloud SQL 직접 연결 테스트")
-        logger.info(f"[DB진단] 대상: {host}:{port}")
+        lines.append(f"[DB진단] 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"[DB진단] GAE -> Cloud SQL 직접 연결 테스트")
+        lines.append(f"[DB진단] 대상: {host}:{port}")
         
         # 1. 소켓 TCP 연결 테스트 (MySQL 서버 포트 접근 가능 여부)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(3)  # 3초 타임아웃
-        result = sock.connect_ex((host, port))
-        sock.close()
-        
-        tcp_conn_status = '성공' if result == 0 else f'실패(코드:{result})'
-        logger.info(f"[DB진단] TCP 연결: {tcp_conn_status}")
+        # GAE에서는 아래 pymysql 연결 오류로 충분히 원인이 드러나므로 생략
+        if is_app_engine():
+            result = 0
+            lines.append(f"[DB진단] TCP 연결 테스트 생략 (App Engine)")
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(2)  # 2초 타임아웃
+            result = sock.connect_ex((host, port))
+            sock.close()
+
+            tcp_conn_status = '성공' if result == 0 else f'실패(코드:{result})'
+            lines.append(f"[DB진단] TCP 연결: {tcp_conn_status}")
         
         # 2. 실제 DB 연결 테스트 (TCP 연결 성공 시만)
-        if result == 0:
+        # pool_pre_ping 사용 시 엔진이 체크아웃마다 연결을 검증하므로 생략
+        if result == 0 and settings.DB_POOL_PRE_PING:
+            lines.append(f"[DB진단] MySQL 연결 테스트 생략 (pool_pre_ping 사용)")
+            success = True
+        elif result == 0:
             try:
                 # 저수준 pymysql 직접 연결 시도
-                logger.info(f"[DB진단] 저수준 pymysql 직접 연결 시도...")
                 conn = pymysql.connect(
                     host=host,
                     user=user,
@@ -62,55 +104,43 @@ def diagnose_db_connection():
                     cursor.execute("SELECT VERSION()")
                     version = cursor.fetchone()[0]
                 
-                logger.info(f"[DB진단] MySQL 연결 성공: 버전 {version}")
+                lines.append(f"[DB진단] MySQL 연결 성공: 버전 {version}")
                 conn.close()
                 
-                # 3. VPC 네트워크 정보 확인 (참고용)
-                try:
-                    # 현재 GAE 인스턴스의 내부 IP 확인
-                    local_ip = socket.gethostbyname(socket.gethostname())
-                    logger.info(f"[DB진단] 현재 GAE 인스턴스 IP: {local_ip}")
-                    
-                    # VPC 커넥터 설정 확인
-                    vpc_connector = os.environ.get("VPC_CONNECTOR", "설정 없음")
-                    logger.info(f"[DB진단] VPC 커넥터: {vpc_connector}")
-                except Exception as e:
-                    logger.warning(f"[DB진단] 네트워크 정보 수집 실패: {str(e)}")
-                
-                return True
+                # 3. VPC 네트워크 정보 확인 (참고용, 인스턴스 정보는 캐시됨)
+                lines.append(f"[DB진단] 현재 인스턴스: {get_local_ip()}")
+                lines.append(f"[DB진단] VPC 커넥터: {os.environ.get('VPC_CONNECTOR', '설정 없음')}")
+                success = True
             except Exception as db_err:
-                logger.error(f"[DB진단] MySQL 연결 실패: {str(db_err)}")
+                lines.append(f"[DB진단] MySQL 연결 실패: {str(db_err)}")
                 
                 # 오류 원인 분석
                 error_msg = str(db_err).lower()
                 if "access denied" in error_msg:
-                    logger.error(f"[DB진단] 원인: 사용자 권한 문제 (액세스 거부)")
+                    lines.append(f"[DB진단] 원인: 사용자 권한 문제 (액세스 거부)")
                 elif "timeout" in error_msg:
-                    logger.error(f"[DB진단] 원인: 연결 타임아웃 (방화벽 또는 네트워크 문제)")
+                    lines.append(f"[DB진단] 원인: 연결 타임아웃 (방화벽 또는 네트워크 문제)")
                 elif "unknown host" in error_msg:
-                    logger.error(f"[DB진단] 원인: 알 수 없는 호스트 (DNS 문제)")
+                    lines.append(f"[DB진단] 원인: 알 수 없는 호스트 (DNS 문제)")
                 else:
-                    logger.error(f"[DB진단] 원인: 기타 문제 - {error_msg}")
-                
-                return False
+                    lines.append(f"[DB진단] 원인: 기타 문제 - {error_msg}")
         else:
             # TCP 연결 실패 원인 분석
             if result == 111:  # Connection refused
-                logger.error(f"[DB진단] 원인: 연결 거부 - DB 서버가 실행 중이 아니거나 포트가 열려있지 않음")
+                lines.append(f"[DB진단] 원인: 연결 거부 - DB 서버가 실행 중이 아니거나 포트가 열려있지 않음")
             elif result == 110:  # Connection timed out
-                logger.error(f"[DB진단] 원인: 타임아웃 - 방화벽 규칙 또는 네트워크 문제")
+                lines.append(f"[DB진단] 원인: 타임아웃 - 방화벽 규칙 또는 네트워크 문제")
             elif result == 113:  # No route to host
-                logger.error(f"[DB진단] 원인: 호스트 경로 없음 - VPC 연결 문제")
+                lines.append(f"[DB진단] 원인: 호스트 경로 없음 - VPC 연결 문제")
             else:
-                logger.error(f"[DB진단] 원인: 알 수 없는 오류 코드 {result}")
-            
-            return False
+                lines.append(f"[DB진단] 원인: 알 수 없는 오류 코드 {result}")
             
     except Exception as e:
-        logger.error(f"[DB진단] 예상치 못한 오류 발생: {str(e)}")
-        return False
+        lines.append(f"[DB진단] 예상치 못한 오류 발생: {str(e)}")
     finally:
-        logger.info(f"[DB진단] 완료")
+        lines.append(f"[DB진단] 완료")
+        logger.log(logging.INFO if success else logging.ERROR, "\n".join(lines))
+    return success
 
 
 # 직접 pymysql로 연결 시도 (대체 방법)
@@ -4,80 +4,143 @@ Cloud SQL 연결 문제 해결을 위한 직접 연결 메커니즘 제공
 """
 
 import logging
+import re
 import pymysql
 from functools import lru_cache
+from sqlalchemy.pool import QueuePool
 
 logger = logging.getLogger(__name__)
 
+# 결과 행을 반환하는 쿼리 판별용 (호출마다 문자열 복사 없이 정규식 1회 매칭)
+_SELECT_RE = re.compile(r"\s*SELECT\b", re.IGNORECASE)
+
 class DirectMySQLConnection:
     """
     SQLAlchemy를 우회하고 직접 pymysql로 데이터베이스에 연결하는 클래스
     연결 실패 시 폴백 메커니즘으로 사용
+    단일 연결 대신 커넥션 풀을 사용하여 여러 호출자가 동시에 사용 가능
     """
     
-    def __init__(self, host, user, password, database, port=3306):
+    def __init__(self, host, user, password, database, port=3306, pool_size=5, max_size=20):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.port = port
-        self.connection = None
-        
-    def connect(self):
-        """데이터베이스에 연결"""
-        if self.connection is not None:
-            return
-            
-        logger.info(f"[직접연결] {self.host}:{self.port}에 직접 연결 시도")
-        self.connection = pymysql.connect(
+        self.pool_size = pool_size
+        self.max_size = max_size
+        self.pool = None
+
+    def _create_connection(self):
+        """풀에서 사용할 새 pymysql 연결 생성"""
+        return pymysql.connect(
             host=self.host,
             user=self.user,
             password=self.password,
             database=self.database,
             port=self.port,
             charset='utf8mb4',
-            connect_timeout=5
+            connect_timeout=5,
+            cursorclass=pymysql.cursors.DictCursor,
+        )
+        
+    def connect(self):
+        """커넥션 풀 생성 (연결은 필요할 때 생성됨)"""
+        if self.pool is not None:
+            return
+            
+        logger.info(f"[직접연결] {self.host}:{self.port} 커넥션 풀 생성 (최대 {self.max_size}개)")
+        self.pool = QueuePool(
+            self._create_connection,
+            pool_size=self.pool_size,
+            max_overflow=self.max_size - self.pool_size,
+            recycle=1800,
         )
-        logger.info(f"[직접연결] 성공")
         
     def disconnect(self):
-        """연결 종료"""
-        if self.connection is not None:
-            self.connection.close()
-            self.connection = None
-            logger.info(f"[직접연결] 연결 종료")
+        """커넥션 풀 종료"""
+        if self.pool is not None:
+            self.pool.dispose()
+            self.pool = None
+            logger.info(f"[직접연결] 커넥션 풀 종료")
             
     def execute_query(self, query, params=None):
         """
         쿼리 실행 및 결과 반환
         SELECT 쿼리의 경우 결과를 딕셔너리 리스트로 반환
         """
-        if self.connection is None:
+        if self.pool is None:
             self.connect()
             
+        conn = self.pool.connect()
         try:
-            with self.connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(query, params)
-                if query.strip().upper().startswith('SELECT'):
+                if _SELECT_RE.match(query):
                     result = cursor.fetchall()
                     return result
                 else:
-                    self.connection.commit()
+                    conn.commit()
                     return {'affected_rows': cursor.rowcount}
         except Exception as e:
             logger.error(f"[직접연결] 쿼리 실행 오류: {str(e)}")
-            if self.connection:
-                self.connection.rollback()
+            conn.rollback()
             raise
+        finally:
+            conn.close()  # 풀에 반환
             
+    def execute_many(self, query, seq_of_params):
+        """
+        같은 쿼리를 여러 파라미터로 일괄 실행 (INSERT는 pymysql이 다중 VALUES로 변환)
+        영향받은 행 수 반환
+        """
+        if self.pool is None:
+            self.connect()
+
+        conn = self.pool.connect()
+        try:
+            with conn.cursor() as cursor:
+                cursor.executemany(query, seq_of_params)
+                conn.commit()
+                return cursor.rowcount
+        except Exception as e:
+            logger.error(f"[직접연결] 일괄 실행 오류: {str(e)}")
+            conn.rollback()
+            raise
+        finally:
+            conn.close()  # 풀에 반환
+
+    def stream_query(self, query, params=None, arraysize=1000):
+        """
+        SELECT 결과를 arraysize 단위 묶음으로 반환하는 제너레이터
+        (SSDictCursor로 서버에서 스트리밍하여 전체 결과를 메모리에 올리지 않음)
+        """
+        if self.pool is None:
+            self.connect()
+
+        conn = self.pool.connect()
+        try:
+            with conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(arraysize)
+                    if not rows:
+                        break
+                    yield rows
+        except Exception as e:
+            logger.error(f"[직접연결] 스트리밍 조회 오류: {str(e)}")
+            raise
+        finally:
+            conn.close()  # 풀에 반환
+
     def __enter__(self):
         """컨텍스트 매니저 진입"""
         self.connect()
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """컨텍스트 매니저 종료"""
-        self.disconnect()
+        """컨텍스트 매니저 종료 (공유 풀이므로 종료하지 않음, 필요 시 disconnect 호출)"""
+        return False
 
 
 # 싱글톤 인스턴스를 제공하는 함수
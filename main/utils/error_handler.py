@@ -2,20 +2,23 @@
 오류 처리를 위한 공통 유틸리티 함수
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Final, Optional, List
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging  # 표준 로깅 임포트
 
 logger = logging.getLogger(__name__)  # 로거 인스턴스 생성
 
+# 락 때문에 실패한 항목을 구분하기 위한 메시지 문구
+LOCK_MESSAGE_MARKER: Final[str] = "다른 사용자가"
+
 
 def create_error_response(
     message: str,
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
     error_code: Optional[str] = None,
     details: Optional[Dict[str, Any]] = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     표준화된 오류 응답 생성
 
@@ -26,23 +29,27 @@ def create_error_response(
         details: 상세 오류 정보 (선택)
 
     Returns:
-        JSONResponse: 오류 응답
+        ORJSONResponse: 오류 응답 (orjson 직렬화)
     """
-    content = {"success": False, "message": message}
-
-    if error_code:
-        content["error_code"] = error_code
-
-    if details:
-        content["details"] = details
+    # 값이 없는 선택 항목은 제외하여 한 번에 구성
+    content = {
+        key: value
+        for key, value in (
+            ("success", False),
+            ("message", message),
+            ("error_code", error_code or None),
+            ("details", details or None),
+        )
+        if value is not None
+    }
 
-    # 오류 로깅
-    logger.error(f"오류 응답: {message} (코드: {status_code}, 내부 코드: {error_code})")
-    if details:
-        # logger.debug(f"오류 상세 정보: {details}") # 프로덕션에서 불필요한 로그 제거
-        pass  # debug 로그만 있었으므로 pass 추가
+    # 오류 로깅 (서버 오류만 ERROR, 클라이언트 오류는 DEBUG)
+    if status_code >= 500:
+        logger.error(f"오류 응답: {message} (코드: {status_code}, 내부 코드: {error_code})")
+    else:
+        logger.debug(f"오류 응답: {message} (코드: {status_code}, 내부 코드: {error_code})")
 
-    return JSONResponse(status_code=status_code, content=content)
+    return ORJSONResponse(status_code=status_code, content=content)
 
 
 def create_success_response(
@@ -109,15 +116,15 @@ def validate_batch_results(
     Returns:
         Dict: 결과 요약
     """
-    success_count = sum(1 for item in results if item.get("success", False))
-    failed_count = sum(1 for item in results if not item.get("success", False))
-
-    # 실패한 항목 중에서 락 때문에 실패한 항목 카운트
-    lock_count = sum(
-        1
-        for item in results
-        if not item.get("success", False) and "다른 사용자가" in item.get("message", "")
-    )
+    # 한 번의 순회로 성공/락 실패 건수 집계
+    success_count = lock_count = 0
+    for item in results:
+        if item.get("success", False):
+            success_count += 1
+        elif LOCK_MESSAGE_MARKER in (item.get("message") or ""):
+            # 실패한 항목 중에서 락 때문에 실패한 항목
+            lock_count += 1
+    failed_count = len(results) - success_count
 
     # 일반 실패 (락 제외)
     general_fail_count = failed_count - lock_count
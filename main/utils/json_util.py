@@ -5,38 +5,64 @@ JSON 관련 유틸리티
 import json
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Dict
 import logging
+import orjson
 from sqlalchemy import Column
 
 logger = logging.getLogger(__name__)
 
+# 타입별 변환 함수 (isinstance 체인 대신 type() 조회 1회로 처리)
+_TYPE_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    Decimal: float,
+    datetime: lambda obj: obj.strftime("%Y-%m-%dT%H:%M"),
+    date: lambda obj: obj.strftime("%Y-%m-%d"),
+}
+
+# datetime/date는 기본 ISO 출력 대신 기존 포맷을 유지하도록 default로 전달
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_default(obj: Any) -> Any:
+    """표준 JSON 타입이 아닌 값 변환 (orjson/json 공용)"""
+    handler = _TYPE_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+
+    # SQLAlchemy Column 타입 처리
+    if isinstance(obj, Column):
+        return str(obj)
+
+    # 하위 클래스 등 정확히 일치하지 않는 타입
+    for base, handler in _TYPE_HANDLERS.items():
+        if isinstance(obj, base):
+            return handler(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     """
     커스텀 JSON 인코더
     FastAPI의 응답과 템플릿에서 사용할 수 있는 확장 JSON 직렬화 지원
+    (cls= 로 전달하는 기존 호출부 호환용)
     """
 
     def default(self, obj: Any) -> Any:
-        # SQLAlchemy Column 타입 처리
-        if isinstance(obj, Column):
-            return str(obj)
-
-        # Decimal 타입 처리
-        if isinstance(obj, Decimal):
-            return float(obj)
-
-        # datetime 타입 처리
-        if isinstance(obj, datetime):
-            return obj.strftime("%Y-%m-%dT%H:%M")
+        try:
+            return _encode_default(obj)
+        except TypeError:
+            # 나머지는 기본 인코더에 위임
+            return super().default(obj)
 
-        # date 타입 처리
-        if isinstance(obj, date):
-            return obj.strftime("%Y-%m-%d")
 
-        # 나머지는 기본 인코더에 위임
-        return super().default(obj)
+def _permissive_default(obj: Any) -> Any:
+    """변환할 수 없는 값은 경고 로그 후 문자열로 대체"""
+    try:
+        return _encode_default(obj)
+    except TypeError:
+        logger.warning("직렬화 불가능한 값을 문자열로 대체: %s", type(obj).__name__)
+        return str(obj)
 
 
 def custom_json_dumps(obj: Any) -> str:
@@ -50,33 +76,8 @@ def custom_json_dumps(obj: Any) -> str:
         str: JSON 문자열
     """
     try:
-        return json.dumps(obj, cls=CustomJSONEncoder, ensure_ascii=False)
+        return orjson.dumps(obj, default=_encode_default, option=_ORJSON_OPTIONS).decode()
     except TypeError as e:
-        # 직렬화 불가능한 객체 처리
-        logger.error(f"JSON 직렬화 오류: {str(e)}")
-
-        # 객체 타입 로깅
-        if hasattr(obj, "__dict__"):
-            # logger.debug( # 프로덕션에서 불필요한 로그 제거
-            #     f"객체 타입: {type(obj).__name__}, 속성: {list(obj.__dict__.keys())}"
-            # )
-            pass  # debug 로그만 있었으므로 pass 추가
-
-        # 딕셔너리인 경우 문제 필드 찾기
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                try:
-                    json.dumps({key: value}, cls=CustomJSONEncoder)
-                except TypeError:
-                    logger.error(
-                        f"직렬화 불가능한 필드: {key}={value}, 타입={type(value).__name__}"
-                    )
-                    # 재귀적으로 객체 처리
-                    obj[key] = str(value)
-
-        # 다시 시도
-        try:
-            return json.dumps(obj, cls=CustomJSONEncoder, ensure_ascii=False)
-        except:
-            # 마지막 시도 - 문자열 변환
-            return json.dumps(str(obj), ensure_ascii=False)
+        # 직렬화 불가능한 값은 문자열로 대체하여 한 번만 재시도 (입력 객체는 변경하지 않음)
+        logger.error("JSON 직렬화 오류: %s", e)
+        return json.dumps(obj, default=_permissive_default, ensure_ascii=False)
@@ -5,60 +5,104 @@
 from typing import Dict, Any, Tuple, List, TypeVar, Generic, Optional, Callable
 from sqlalchemy.orm import Query
 from sqlalchemy import func
+import logging
 
 T = TypeVar("T")
 
+_log = logging.getLogger("pagination")
+
+
+def build_pagination(total_items: int, page: int, page_size: int) -> Dict[str, Any]:
+    """
+    전체 항목 수로부터 페이지네이션 메타데이터를 계산합니다.
+
+    Args:
+        total_items: 전체 항목 수
+        page: 요청 페이지 번호 (범위를 벗어나면 조정됨)
+        page_size: 페이지당 항목 수
+
+    Returns:
+        Dict[str, Any]: 페이지네이션 메타데이터 (current_page는 조정된 값)
+    """
+    # 전체 페이지 수 계산 (최소 1페이지)
+    total_pages = max(1, (total_items + page_size - 1) // page_size)
+
+    # 페이지 범위 검증 및 조정
+    if page < 1:
+        page = 1
+    elif page > total_pages:
+        page = total_pages
+
+    # 오프셋 계산
+    offset = (page - 1) * page_size
+
+    # 페이지네이션 메타데이터 구성 (라우터와 키 이름 통일)
+    return {
+        "total_items": total_items,
+        "page_size": page_size,
+        "current_page": page,
+        "total_pages": total_pages,
+        "start_index": offset + 1 if total_items > 0 else 0,
+        "end_index": min(offset + page_size, total_items) if total_items > 0 else 0,
+    }
+
 
 def paginate_query(
-    query: Query, page: int = 1, page_size: int = 10
+    query: Query, page: int = 1, page_size: int = 10, with_total: bool = True
 ) -> Tuple[List[Any], Dict[str, Any]]:
     """
     SQLAlchemy 쿼리에 페이지네이션을 적용하고 결과와 메타데이터를 반환합니다.
+    전체 항목 수는 COUNT(*) OVER ()로 페이지 조회와 같은 쿼리에서 함께 가져옵니다.
 
     Args:
-        query: 페이지네이션을 적용할 SQLAlchemy 쿼리
+        query: 페이지네이션을 적용할 SQLAlchemy 쿼리 (단일 엔티티 조회)
         page: 페이지 번호 (1부터 시작)
         page_size: 페이지당 항목 수
+        with_total: False이면 전체 건수 없이 page_size+1건 조회로 다음 페이지 여부만 판단
 
     Returns:
         Tuple[List[Any], Dict[str, Any]]: (페이지 항목 목록, 페이지네이션 메타데이터)
     """
     try:
-        # 전체 항목 수 조회
-        total_items = query.count()
-
-        # 전체 페이지 수 계산 (최소 1페이지)
-        total_pages = max(1, (total_items + page_size - 1) // page_size)
+        page = max(page, 1)
+        offset = (page - 1) * page_size
 
-        # 페이지 범위 검증 및 조정
-        if page < 1:
-            page = 1
-        elif page > total_pages and total_pages > 0:
-            page = total_pages
+        if not with_total:
+            # 대용량 테이블용: COUNT 없이 1건 더 조회하여 다음 페이지 존재 여부 판단
+            items = query.offset(offset).limit(page_size + 1).all()
+            has_next = len(items) > page_size
+            items = items[:page_size]
+            pagination = {
+                "total_items": None,
+                "page_size": page_size,
+                "current_page": page,
+                "total_pages": None,
+                "start_index": offset + 1 if items else 0,
+                "end_index": offset + len(items),
+                "has_next": has_next,
+            }
+            return items, pagination
 
-        # 오프셋 계산
-        offset = (page - 1) * page_size
+        windowed = query.add_columns(func.count().over().label("total_count"))
+        rows = windowed.offset(offset).limit(page_size).all()
 
-        # 쿼리에 페이지네이션 적용하여 결과 가져오기
-        items = query.offset(offset).limit(page_size).all() if total_items > 0 else []
+        if rows:
+            total_items = rows[0].total_count
+        elif page > 1:
+            # 범위를 벗어난 페이지 요청 시에만 건수를 따로 조회하여 마지막 페이지로 조정
+            total_items = query.order_by(None).count()
+        else:
+            total_items = 0
 
-        # 페이지네이션 메타데이터 구성 (라우터와 키 이름 통일)
-        pagination = {
-            "total_items": total_items,
-            "page_size": page_size,
-            "current_page": page,
-            "total_pages": total_pages,
-            "start_index": offset + 1 if total_items > 0 else 0,
-            "end_index": min(offset + page_size, total_items) if total_items > 0 else 0,
-        }
+        pagination = build_pagination(total_items, page, page_size)
+        if not rows and total_items > 0:
+            offset = (pagination["current_page"] - 1) * page_size
+            rows = windowed.offset(offset).limit(page_size).all()
 
+        items = [row[0] for row in rows]
         return items, pagination
     except Exception as e:
-        import logging
-
-        logging.getLogger("pagination").error(
-            f"페이지네이션 처리 중 오류 발생: {str(e)}"
-        )
+        _log.error("페이지네이션 처리 중 오류 발생: %s", e)
 
         # 오류 발생 시 안전한 기본값 반환 (키 이름 통일)
         fallback_pagination = {
@@ -72,9 +116,27 @@ def paginate_query(
         return [], fallback_pagination
 
 
+# 상태 값 → 통계 키 매핑
+_STATUS_STAT_KEYS = {
+    "WAITING": "waiting",
+    "IN_PROGRESS": "in_progress",
+    "COMPLETE": "complete",
+    "ISSUE": "issue",
+    "CANCEL": "cancel",
+}
+
+
+def _empty_dashboard_stats() -> Dict[str, int]:
+    """통계 기본값 (모든 항목 0)"""
+    stats = {"total": 0}
+    stats.update({key: 0 for key in _STATUS_STAT_KEYS.values()})
+    return stats
+
+
 def calculate_dashboard_stats(query: Query) -> Dict[str, int]:
     """
     대시보드 통계 정보를 계산합니다.
+    상태별 GROUP BY 한 번으로 집계하고 결과(최대 5행)를 Python에서 변환합니다.
 
     Args:
         query: 통계를 계산할 SQLAlchemy 쿼리
@@ -83,57 +145,24 @@ def calculate_dashboard_stats(query: Query) -> Dict[str, int]:
         Dict[str, int]: 상태별 통계 정보
     """
     try:
-        from sqlalchemy import case
         from main.models.dashboard_model import Dashboard
 
         # 통계 쿼리 실행
-        stats_result = query.with_entities(
-            func.count().label("total"),
-            func.sum(case((Dashboard.status == "WAITING", 1), else_=0)).label(
-                "waiting"
-            ),
-            func.sum(case((Dashboard.status == "IN_PROGRESS", 1), else_=0)).label(
-                "in_progress"
-            ),
-            func.sum(case((Dashboard.status == "COMPLETE", 1), else_=0)).label(
-                "complete"
-            ),
-            func.sum(case((Dashboard.status == "ISSUE", 1), else_=0)).label("issue"),
-            func.sum(case((Dashboard.status == "CANCEL", 1), else_=0)).label("cancel"),
-        ).first()
-
-        # 통계 결과를 딕셔너리로 변환
-        if stats_result and hasattr(stats_result, "total"):
-            return {
-                "total": stats_result.total or 0,
-                "waiting": stats_result.waiting or 0,
-                "in_progress": stats_result.in_progress or 0,
-                "complete": stats_result.complete or 0,
-                "issue": stats_result.issue or 0,
-                "cancel": stats_result.cancel or 0,
-            }
-        else:
-            # 결과가 없는 경우 기본값 반환
-            return {
-                "total": 0,
-                "waiting": 0,
-                "in_progress": 0,
-                "complete": 0,
-                "issue": 0,
-                "cancel": 0,
-            }
-    except Exception as e:
-        import logging
-
-        logging.getLogger("pagination").error(
-            f"대시보드 통계 계산 중 오류 발생: {str(e)}"
+        rows = (
+            query.with_entities(Dashboard.status, func.count().label("count"))
+            .order_by(None)
+            .group_by(Dashboard.status)
+            .all()
         )
+
+        stats = _empty_dashboard_stats()
+        for status_value, count in rows:
+            key = _STATUS_STAT_KEYS.get(status_value)
+            if key:
+                stats[key] = count
+            stats["total"] += count
+        return stats
+    except Exception as e:
+        _log.error("대시보드 통계 계산 중 오류 발생: %s", e)
         # 오류 발생 시 안전한 기본값 반환
-        return {
-            "total": 0,
-            "waiting": 0,
-            "in_progress": 0,
-            "complete": 0,
-            "issue": 0,
-            "cancel": 0,
-        }
+        return _empty_dashboard_stats()
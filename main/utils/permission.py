@@ -2,7 +2,61 @@
 권한 검사 유틸리티
 """
 
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+
+# 전체 상태 코드 (표시 순서)
+_ALL_STATUSES: Tuple[str, ...] = (
+    "WAITING",
+    "IN_PROGRESS",
+    "COMPLETE",
+    "ISSUE",
+    "CANCEL",
+)
+_ALL_STATUS_SET: FrozenSet[str] = frozenset(_ALL_STATUSES)
+
+# 상태 레이블 매핑
+_STATUS_LABELS: Dict[str, str] = {
+    "WAITING": "대기",
+    "IN_PROGRESS": "진행",
+    "COMPLETE": "완료",
+    "ISSUE": "이슈",
+    "CANCEL": "취소",
+}
+
+# 역할 코드 (세션의 role_id - 매 호출마다 문자열 비교하지 않도록 정수로 저장)
+ROLE_USER = 0
+ROLE_ADMIN = 1
+
+# 일반 사용자: 현재 상태 → 접근 가능한 상태 집합 (대기/진행 상태에서만 변경 가능)
+# 관리자는 현재 상태와 무관하게 _ALL_STATUS_SET
+_USER_ACCESSIBLE: Dict[str, FrozenSet[str]] = {
+    "WAITING": frozenset({"WAITING", "IN_PROGRESS"}),
+    "IN_PROGRESS": frozenset({"IN_PROGRESS", "COMPLETE", "ISSUE", "CANCEL"}),
+}
+
+# 일반 사용자에게 허용된 상태 전이 (대기 -> 진행, 진행 -> 완료/이슈/취소)
+_USER_TRANSITIONS: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        ("WAITING", "IN_PROGRESS"),
+        ("IN_PROGRESS", "COMPLETE"),
+        ("IN_PROGRESS", "ISSUE"),
+        ("IN_PROGRESS", "CANCEL"),
+    }
+)
+
+
+def role_id_for(user_role: Optional[str]) -> int:
+    """user_role 문자열을 역할 코드로 변환 (로그인 시 1회)"""
+    return ROLE_ADMIN if user_role == "ADMIN" else ROLE_USER
+
+
+def _role_id(user: Dict[str, Any]) -> int:
+    """사용자 정보의 역할 코드 (role_id가 없는 기존 세션은 user_role로 판단)"""
+    role_id = user.get("role_id")
+    if role_id is None:
+        return role_id_for(user.get("user_role", "USER"))
+    return role_id
 
 
 def can_change_status(
@@ -22,27 +76,11 @@ def can_change_status(
     Returns:
         bool: 상태 변경 가능 여부
     """
-    user_role = user.get("user_role", "USER")
-
-    # 관리자는 모든 상태 변경 가능
-    if user_role == "ADMIN":
-        return True
-
-    # 일반 사용자는 제한된 상태 변경만 가능
-    # 대기 -> 진행
-    if current_status == "WAITING" and new_status == "IN_PROGRESS":
-        return True
-
-    # 진행 -> 완료/이슈/취소
-    if current_status == "IN_PROGRESS" and new_status in [
-        "COMPLETE",
-        "ISSUE",
-        "CANCEL",
-    ]:
-        return True
-
-    # 그 외의 경우는 권한 없음
-    return False
+    # 관리자는 모든 상태 변경 가능, 일반 사용자는 허용된 전이만 가능
+    return (
+        _role_id(user) == ROLE_ADMIN
+        or (current_status, new_status) in _USER_TRANSITIONS
+    )
 
 
 def can_edit_order(user: Dict[str, Any], order_data: Dict[str, Any]) -> bool:
@@ -78,22 +116,19 @@ def get_accessible_statuses(user: Dict[str, Any], current_status: str) -> List[s
     Returns:
         List[str]: 접근 가능한 상태 코드 목록
     """
-    user_role = user.get("user_role", "USER")
+    accessible = _accessible_statuses(_role_id(user), current_status)
+    # 표시 순서 유지
+    return [status for status in _ALL_STATUSES if status in accessible] or [
+        current_status
+    ]
 
-    all_statuses = ["WAITING", "IN_PROGRESS", "COMPLETE", "ISSUE", "CANCEL"]
 
-    # 관리자는 모든 상태 접근 가능
-    if user_role == "ADMIN":
-        return all_statuses
-
-    # 일반 사용자는 상태에 따라 다른 상태 옵션
-    if current_status == "WAITING":
-        return ["WAITING", "IN_PROGRESS"]
-    elif current_status == "IN_PROGRESS":
-        return ["IN_PROGRESS", "COMPLETE", "ISSUE", "CANCEL"]
-    else:
-        # 그 외 상태는 변경 불가, 현재 상태만 표시
-        return [current_status]
+def _accessible_statuses(role_id: int, current_status: str) -> FrozenSet[str]:
+    """역할과 현재 상태 기준 접근 가능한 상태 코드 (그 외 상태는 현재 상태만)"""
+    # 관리자는 현재 상태와 무관하게 모든 상태 접근 가능
+    if role_id == ROLE_ADMIN:
+        return _ALL_STATUS_SET
+    return _USER_ACCESSIBLE.get(current_status, frozenset({current_status}))
 
 
 def get_status_options(
@@ -107,30 +142,23 @@ def get_status_options(
         current_status: 현재 상태 코드
 
     Returns:
-        List[Dict[str, str]]: 상태 옵션 목록
+        List[Dict[str, str]]: 상태 옵션 목록 (항목 dict는 캐시와 공유되므로 수정 금지)
     """
-    # 상태 레이블 매핑
-    status_labels = {
-        "WAITING": "대기",
-        "IN_PROGRESS": "진행",
-        "COMPLETE": "완료",
-        "ISSUE": "이슈",
-        "CANCEL": "취소",
-    }
-
-    # 접근 가능한 상태 목록
-    accessible_statuses = get_accessible_statuses(user, current_status)
-
-    # 옵션 목록 생성
-    options = []
-    for status in ["WAITING", "IN_PROGRESS", "COMPLETE", "ISSUE", "CANCEL"]:
-        options.append(
-            {
-                "value": status,
-                "label": status_labels.get(status, status),
-                "selected": status == current_status,
-                "disabled": status not in accessible_statuses,
-            }
-        )
-
-    return options
+    return list(_status_options_cached(_role_id(user), current_status))
+
+
+@lru_cache(maxsize=32)
+def _status_options_cached(
+    role_id: int, current_status: str
+) -> Tuple[Dict[str, Any], ...]:
+    """역할/현재 상태별 옵션 목록 (역할 2개 × 상태 5개이므로 한 번만 생성)"""
+    accessible_statuses = _accessible_statuses(role_id, current_status)
+    return tuple(
+        {
+            "value": status,
+            "label": _STATUS_LABELS.get(status, status),
+            "selected": status == current_status,
+            "disabled": status not in accessible_statuses,
+        }
+        for status in _ALL_STATUSES
+    )
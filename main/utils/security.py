@@ -2,7 +2,12 @@
 인증 및 보안 관련 유틸리티
 """
 
+import asyncio
 import bcrypt
+import os
+from concurrent.futures import ThreadPoolExecutor
+import time
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from fastapi import Depends, HTTPException, Request, status
 from main.utils.config import get_settings
@@ -12,6 +17,18 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# bcrypt 연산 전용 스레드 풀 (이벤트 루프 블로킹 방지, bcrypt는 GIL을 해제함)
+_bcrypt_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> bytes:
+    """잘못된 해시 입력 시 검증 시간을 맞추기 위한 더미 해시 (최초 사용 시 생성)"""
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_COST)
+    return bcrypt.hashpw(b"dummy-password", salt)
+
 
 def hash_password(password: str) -> str:
     """비밀번호를 안전하게 해시화합니다."""
@@ -19,7 +36,7 @@ def hash_password(password: str) -> str:
     password_bytes = password.encode("utf-8")
 
     # 솔트 생성 및 해시 생성
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_COST)
     hashed = bcrypt.hashpw(password_bytes, salt)
 
     # 바이트에서 문자열로 변환하여 반환
@@ -34,10 +51,49 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
         return bcrypt.checkpw(plain_password_bytes, hashed_password_bytes)
     except Exception as e:
-        logger.error(f"비밀번호 검증 중 오류: {str(e)}")
+        logger.error("비밀번호 검증 중 오류: %s", e)
+        # 정상 검증과 비슷한 시간이 걸리도록 더미 검증 수행
+        bcrypt.checkpw(plain_password_bytes, _dummy_hash())
         return False
 
 
+# 해시 1회 목표 소요 시간 (초과 시 BCRYPT_COST 하향 검토)
+_BCRYPT_TARGET_MS = 250
+
+
+def calibrate_bcrypt_cost() -> float:
+    """현재 BCRYPT_COST로 해시 1회 소요 시간을 측정하고, 목표를 넘으면 경고합니다."""
+    started = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=settings.BCRYPT_COST))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if elapsed_ms > _BCRYPT_TARGET_MS:
+        logger.warning(
+            "bcrypt 해시 1회 %.0fms 소요 (cost=%d, 목표 %dms) - BCRYPT_COST 조정 필요",
+            elapsed_ms,
+            settings.BCRYPT_COST,
+            _BCRYPT_TARGET_MS,
+        )
+    else:
+        logger.info(
+            "bcrypt 해시 1회 %.0fms 소요 (cost=%d)", elapsed_ms, settings.BCRYPT_COST
+        )
+    return elapsed_ms
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password를 bcrypt 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password를 bcrypt 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, verify_password, plain_password, hashed_password
+    )
+
+
 def get_current_user(request: Request) -> Dict[str, Any]:
     """
     현재 요청의 세션에서 사용자 정보를 가져옵니다.
@@ -55,12 +111,8 @@ def get_current_user(request: Request) -> Dict[str, Any]:
         HTTPException: 인증되지 않은 경우 (401)
     """
     user = request.session.get("user")
-
-    if user:
-        # logger.debug(f"세션에서 사용자 정보 확인: {user.get('user_id')}") # 프로덕션에서 불필요한 로그 제거
-        pass  # user가 있을 때 debug 로그만 있었으므로 pass 추가
-    else:
-        logger.warning(f"인증되지 않은 접근 시도: {request.url.path}")
+    if not user:
+        logger.warning("인증되지 않은 접근 시도: %s", request.url.path)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="인증이 필요합니다"
         )
@@ -84,7 +136,7 @@ def get_admin_user(
         HTTPException: 관리자가 아닌 경우 (403)
     """
     if user_data.get("user_role") != "ADMIN":
-        logger.warning(f"관리자 권한 필요 접근 시도: user={user_data.get('user_id')}")
+        logger.warning("관리자 권한 필요 접근 시도: user=%s", user_data.get("user_id"))
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다"
         )
@@ -0,0 +1,19 @@
+"""
+요청 단위 DB 세션 미들웨어
+"""
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from main.utils.database import begin_request_scope, close_request_session
+
+
+class DBSessionMiddleware(BaseHTTPMiddleware):
+    """요청마다 세션 범위를 열고, 응답 후 해당 요청의 DB 세션을 한 번만 닫음"""
+
+    async def dispatch(self, request: Request, call_next):
+        token = begin_request_scope()
+        try:
+            return await call_next(request)
+        finally:
+            close_request_session(token)